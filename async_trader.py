@@ -0,0 +1,169 @@
+"""Asyncio variants of the trading loops built on aiohttp.
+
+The synchronous loops in ``auto_trader.py`` and ``predictive_trader.py``
+block on every price fetch and ``time.sleep``, so one process can only
+watch one symbol. These coroutines run the same strategies on a shared
+``aiohttp.ClientSession`` so many symbol loops run concurrently and the
+event loop stays free during network waits. The strategies remain
+educational examples only and are not financial advice.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+
+import aiohttp
+
+from auto_trader import BASE_URL, _client_order_id, get_headers
+from predictive_trader import predict_trend
+
+
+async def fetch_price(session: aiohttp.ClientSession, symbol: str = "BTC-USD") -> float:
+    """Fetch the latest ask price for the given symbol."""
+    path = f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
+    headers = get_headers(path, "GET")
+    async with session.get(BASE_URL + path, headers=headers) as response:
+        response.raise_for_status()
+        data = await response.json()
+    return float(data["results"][0]["ask_inclusive_of_buy_spread"])
+
+
+async def place_market_order(
+    session: aiohttp.ClientSession, symbol: str, side: str, usd_amount: float
+) -> dict:
+    """Place a market order for the specified USD amount."""
+    price = await fetch_price(session, symbol)
+    btc_quantity = usd_amount / price
+    path = "/api/v1/crypto/trading/orders/"
+    body = json.dumps({
+        "client_order_id": _client_order_id(),
+        "side": side,
+        "symbol": symbol,
+        "type": "market",
+        "market_order_config": {"asset_quantity": f"{btc_quantity:.8f}"},
+    })
+    headers = get_headers(path, "POST", body)
+    async with session.post(BASE_URL + path, headers=headers, data=body) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def auto_trade(
+    session: aiohttp.ClientSession,
+    symbol: str = "BTC-USD",
+    usd_amount: float = 5.0,
+    short_window: int = 3,
+    long_window: int = 7,
+    interval: int = 60,
+    iterations: int | None = None,
+) -> None:
+    """Run the moving average crossover loop for one symbol."""
+    # Bounded deques plus running sums give O(1) moving averages per tick
+    # and keep memory constant over an indefinitely long loop.
+    short_prices: deque = deque(maxlen=short_window)
+    long_prices: deque = deque(maxlen=long_window)
+    short_sum = long_sum = 0.0
+    prev_short = prev_long = None
+    holding = False
+    counter = 0
+
+    while True:
+        try:
+            price = await fetch_price(session, symbol)
+            if len(short_prices) == short_window:
+                short_sum -= short_prices[0]
+            short_prices.append(price)
+            short_sum += price
+            if len(long_prices) == long_window:
+                long_sum -= long_prices[0]
+            long_prices.append(price)
+            long_sum += price
+            logging.info("Price fetched for %s: %s", symbol, price)
+
+            if len(long_prices) == long_window:
+                short_ma = short_sum / short_window
+                long_ma = long_sum / long_window
+
+                if prev_short is not None and prev_long is not None:
+                    if short_ma > long_ma and prev_short <= prev_long and not holding:
+                        logging.info("Signal BUY. short_ma=%.2f long_ma=%.2f", short_ma, long_ma)
+                        await place_market_order(session, symbol, "buy", usd_amount)
+                        holding = True
+                    elif short_ma < long_ma and prev_short >= prev_long and holding:
+                        logging.info("Signal SELL. short_ma=%.2f long_ma=%.2f", short_ma, long_ma)
+                        await place_market_order(session, symbol, "sell", usd_amount)
+                        holding = False
+
+                prev_short = short_ma
+                prev_long = long_ma
+
+            counter += 1
+            if iterations is not None and counter >= iterations:
+                break
+
+            await asyncio.sleep(interval)
+        except Exception as exc:
+            logging.error("Trading loop error for %s: %s", symbol, exc)
+            await asyncio.sleep(interval)
+
+
+async def predictive_trade(
+    session: aiohttp.ClientSession,
+    symbol: str = "BTC-USD",
+    usd_amount: float = 5.0,
+    window: int = 5,
+    interval: int = 600,
+    iterations: int | None = None,
+) -> None:
+    """Run the trend prediction loop for one symbol."""
+    # Bounded deque: predict_trend only looks at the last ``window``
+    # prices, so the loop's memory stays constant.
+    prices: deque = deque(maxlen=window)
+    holding = False
+    counter = 0
+
+    while True:
+        try:
+            price = await fetch_price(session, symbol)
+            prices.append(price)
+            logging.info("Price fetched for %s: %s", symbol, price)
+
+            direction = predict_trend(prices, window)
+            if direction > 0 and not holding:
+                logging.info("Predicted up trend. Buying %s", usd_amount)
+                await place_market_order(session, symbol, "buy", usd_amount)
+                holding = True
+            elif direction < 0 and holding:
+                logging.info("Predicted down trend. Selling %s", usd_amount)
+                await place_market_order(session, symbol, "sell", usd_amount)
+                holding = False
+
+            counter += 1
+            if iterations is not None and counter >= iterations:
+                break
+
+            await asyncio.sleep(interval)
+        except Exception as exc:
+            logging.error("Predictive loop error for %s: %s", symbol, exc)
+            await asyncio.sleep(interval)
+
+
+async def trade_many(symbols: list, **kwargs) -> None:
+    """Run the crossover loop concurrently for several symbols."""
+    connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await asyncio.gather(*(auto_trade(session, sym, **kwargs) for sym in symbols))
+
+
+if __name__ == "__main__":
+    try:
+        # uvloop's libuv-based event loop roughly doubles raw socket
+        # throughput when polling many symbols; fall back silently where
+        # it is unavailable (e.g. Windows).
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(trade_many(["BTC-USD"]))
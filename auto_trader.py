@@ -6,23 +6,25 @@ The example strategy is for educational purposes only and does not
 constitute financial advice. Use at your own risk.
 """
 
-import base64
-import json
-import os
+import threading
 import time
-import uuid
 import logging
-from statistics import mean
-
-import requests
-from dotenv import load_dotenv
-from nacl.signing import SigningKey
-
-load_dotenv()
-
-API_KEY = os.getenv("API_KEY")
-PRIVATE_KEY_BASE64 = os.getenv("PRIVATE_KEY_BASE64")
-BASE_URL = os.getenv("BASE_URL")
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import orjson
+from cachetools import TTLCache
+
+# The session, signing-key cache, header builder and order-id helper are
+# shared with the proxy so this script does not keep a second copy of
+# the client plumbing (or a second SigningKey) in memory.
+from trading_core import (
+    BASE_URL,
+    SESSION,
+    _client_order_id,
+    get_headers,
+)
 
 logging.basicConfig(
     filename="auto_trader.log",
@@ -30,44 +32,87 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 
+_ORDERS_PATH = "/api/v1/crypto/trading/orders/"
 
-def generate_signature(api_key: str, timestamp: str, path: str, method: str, body: str = "") -> str:
-    """Generate an HMAC-based signature."""
-    message = f"{api_key}{timestamp}{path}{method}{body}"
-    private_key = SigningKey(base64.b64decode(PRIVATE_KEY_BASE64))
-    signature = private_key.sign(message.encode("utf-8")).signature
-    return base64.b64encode(signature).decode("utf-8")
+# Separate connect vs read timeouts: a slow handshake or DNS stall is
+# cut off quickly instead of holding a worker for the full read budget.
+_TIMEOUT = (3.05, 10)
 
 
-def get_headers(path: str, method: str, body: str = "") -> dict:
-    timestamp = str(int(time.time()))
-    signature = generate_signature(API_KEY, timestamp, path, method, body)
-    return {
-        "x-api-key": API_KEY,
-        "x-signature": signature,
-        "x-timestamp": timestamp,
-        "Content-Type": "application/json",
-    }
+@lru_cache(maxsize=64)
+def _bid_ask_path(symbol: str) -> str:
+    return f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
+
+
+# Quotes barely move within a second; a short TTL collapses duplicate
+# market-data calls from back-to-back fetches into one API hit.
+# TTLCache is not thread-safe and fetch_prices_concurrent drives this
+# from worker threads, so all access goes through the lock.
+_price_cache: TTLCache = TTLCache(maxsize=256, ttl=1.0)
+_price_cache_lock = threading.Lock()
 
 
 def fetch_price(symbol: str = "BTC-USD") -> float:
     """Fetch the latest ask price for the given symbol."""
-    path = f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
+    with _price_cache_lock:
+        cached = _price_cache.get(symbol)
+    if cached is not None:
+        return cached
+    path = _bid_ask_path(symbol)
     url = BASE_URL + path
     headers = get_headers(path, "GET")
-    response = requests.get(url, headers=headers, timeout=10)
+    response = SESSION.get(url, headers=headers, timeout=_TIMEOUT)
     response.raise_for_status()
-    data = response.json()
-    return float(data["results"][0]["ask_inclusive_of_buy_spread"])
+    data = orjson.loads(response.content)
+    price = float(data["results"][0]["ask_inclusive_of_buy_spread"])
+    with _price_cache_lock:
+        _price_cache[symbol] = price
+    return price
+
+
+def fetch_prices(symbols: list) -> dict:
+    """Fetch the latest ask prices for several symbols in one request.
+
+    The best_bid_ask endpoint accepts repeated ``symbol=`` parameters, so
+    watching N symbols costs one round-trip instead of N.
+    """
+    path = "/api/v1/crypto/marketdata/best_bid_ask/?" + "&".join(
+        f"symbol={s}" for s in symbols
+    )
+    url = BASE_URL + path
+    headers = get_headers(path, "GET")
+    response = SESSION.get(url, headers=headers, timeout=_TIMEOUT)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    prices = {
+        row["symbol"]: float(row["ask_inclusive_of_buy_spread"])
+        for row in data["results"]
+    }
+    with _price_cache_lock:
+        _price_cache.update(prices)
+    return prices
+
+
+def fetch_prices_concurrent(symbols: list, max_workers: int = 8) -> dict:
+    """Fetch prices for several symbols in parallel threads.
+
+    A sync alternative to the batched ``fetch_prices`` for symbol lists
+    too long for one query string. Workers share the pooled ``SESSION``,
+    so each thread reuses a warm keep-alive connection.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(symbols, executor.map(fetch_price, symbols)))
 
 
 def place_market_order(symbol: str, side: str, usd_amount: float) -> dict:
     """Place a market order for the specified USD amount."""
     price = fetch_price(symbol)
     btc_quantity = usd_amount / price
-    path = "/api/v1/crypto/trading/orders/"
-    body = json.dumps({
-        "client_order_id": str(uuid.uuid4()),
+    # Serialize once to compact bytes; the same buffer feeds the signature
+    # and the POST body, avoiding two extra encode passes.
+    path = _ORDERS_PATH
+    body = orjson.dumps({
+        "client_order_id": _client_order_id(),
         "side": side,
         "symbol": symbol,
         "type": "market",
@@ -75,9 +120,9 @@ def place_market_order(symbol: str, side: str, usd_amount: float) -> dict:
     })
     headers = get_headers(path, "POST", body)
     url = BASE_URL + path
-    response = requests.post(url, headers=headers, data=body, timeout=10)
+    response = SESSION.post(url, headers=headers, data=body, timeout=_TIMEOUT)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def auto_trade(
@@ -106,7 +151,11 @@ def auto_trade(
         If provided, the loop runs a finite number of iterations. Useful for
         testing. ``None`` means run indefinitely.
     """
-    prices = []
+    # Bounded deques plus running sums give O(1) moving averages per tick
+    # and keep memory constant over an indefinitely long loop.
+    short_prices: deque = deque(maxlen=short_window)
+    long_prices: deque = deque(maxlen=long_window)
+    short_sum = long_sum = 0.0
     prev_short = prev_long = None
     holding = False
     counter = 0
@@ -114,12 +163,19 @@ def auto_trade(
     while True:
         try:
             price = fetch_price(symbol)
-            prices.append(price)
+            if len(short_prices) == short_window:
+                short_sum -= short_prices[0]
+            short_prices.append(price)
+            short_sum += price
+            if len(long_prices) == long_window:
+                long_sum -= long_prices[0]
+            long_prices.append(price)
+            long_sum += price
             logging.info("Price fetched: %s", price)
 
-            if len(prices) >= long_window:
-                short_ma = mean(prices[-short_window:])
-                long_ma = mean(prices[-long_window:])
+            if len(long_prices) == long_window:
+                short_ma = short_sum / short_window
+                long_ma = long_sum / long_window
 
                 if prev_short is not None and prev_long is not None:
                     if short_ma > long_ma and prev_short <= prev_long and not holding:
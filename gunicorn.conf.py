@@ -0,0 +1,13 @@
+"""Gunicorn settings for the proxy.
+
+The Werkzeug dev server handles one request at a time, which serializes
+an I/O-bound proxy behind each upstream network wait. gevent workers let
+each process juggle many in-flight proxy calls; keep-alive matches the
+upstream session so inbound connections are reused too.
+"""
+
+bind = "0.0.0.0:5000"
+worker_class = "gevent"
+workers = 4
+worker_connections = 1000
+keepalive = 75
@@ -8,12 +8,13 @@ The strategy is illustrative only and not financial advice.
 
 import logging
 import time
-from typing import List
+from collections import deque
+from typing import Sequence
 
 from auto_trader import fetch_price, place_market_order
 
 
-def predict_trend(prices: List[float], window: int) -> int:
+def predict_trend(prices: Sequence[float], window: int) -> int:
     """Predict price direction using a basic trend calculation."""
     if len(prices) < window:
         return 0
@@ -34,7 +35,9 @@ def predictive_trade(
     iterations: int | None = None,
 ) -> None:
     """Run the predictive trading loop."""
-    prices: List[float] = []
+    # Only the last ``window`` prices matter; a bounded deque keeps memory
+    # O(window) instead of growing for the lifetime of the loop.
+    prices: deque = deque(maxlen=window)
     holding = False
     counter = 0
 
@@ -1,17 +1,30 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
 import base64
+from binascii import b2a_base64
+import queue
+import threading
 import time
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+from functools import lru_cache
+from urllib.parse import urlencode
+from cachetools import LRUCache
 from dotenv import load_dotenv
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 import hmac
 import hashlib
+import redis
 
 # Load environment variables
 load_dotenv()
@@ -20,87 +33,261 @@ load_dotenv()
 app = Flask(__name__)
 CORS(app)
 
-# Configure Redis as the storage backend for rate limiting
+# Configure rate-limit storage. Redis (pooled, so no fresh socket per
+# rate-limit check) is the multi-process default; a single-process dev
+# deployment can set LIMITER_STORAGE=memory:// and skip the per-request
+# Redis round-trip entirely.
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")  # Update as necessary
+LIMITER_STORAGE = os.getenv("LIMITER_STORAGE", REDIS_URL)
 limiter = Limiter(
     app,
     key_func=get_remote_address,
-    storage_uri=REDIS_URL if REDIS_URL else "memory://",  # Fallback to in-memory storage
+    storage_uri=LIMITER_STORAGE,
+    storage_options=(
+        {"connection_pool": redis.BlockingConnectionPool.from_url(
+            LIMITER_STORAGE,
+            max_connections=20,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )}
+        if LIMITER_STORAGE.startswith("redis") else {}
+    ),
+    strategy="moving-window",
     default_limits=["10 per minute"]
 )
 
-# Configure logging
-logging.basicConfig(
-    filename="trading_log.txt",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
+# Configure logging through a queue: handlers only enqueue records, and
+# a background listener owns the file handler, so request workers never
+# block on disk I/O for a log line.
+_log_queue = queue.Queue(-1)
+# Rotation keeps the log bounded so the listener never stalls on an
+# ever-growing file (or fills the disk) under sustained traffic.
+_file_handler = RotatingFileHandler("trading_log.txt", maxBytes=10_000_000, backupCount=3)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 )
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Shared HTTP session with pooled keep-alive connections so repeated
+# Robinhood calls reuse one TLS connection instead of re-handshaking.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+))
 
 # Load API credentials
 API_KEY = os.getenv("API_KEY")
 PRIVATE_KEY_BASE64 = os.getenv("PRIVATE_KEY_BASE64")
 BASE_URL = os.getenv("BASE_URL")
 
+# Decode the shared secret once at import instead of on every signature,
+# and pre-encode the constant API key so the signed message is built as
+# bytes without f-string formatting.
+_SECRET = base64.b64decode(PRIVATE_KEY_BASE64) if PRIVATE_KEY_BASE64 else None
+_API_KEY_B = API_KEY.encode() if API_KEY else b""
+
+def _json_response(payload, status=200):
+    """Serialize a response with orjson instead of jsonify's stdlib json."""
+    return app.response_class(
+        orjson.dumps(payload), mimetype="application/json", status=status
+    )
+
+# Signed headers are sensitive and expensive to stringify; only dump
+# them when explicitly requested.
+_DEBUG_HEADERS = os.getenv("DEBUG_HEADERS") == "1"
+
+def _client_order_id():
+    # Only uniqueness matters for client_order_id; building the UUID
+    # straight from urandom bytes keeps the dashed format the API
+    # expects while skipping uuid4()'s extra wrapper work.
+    return str(uuid.UUID(bytes=os.urandom(16), version=4))
+
+# The (path, method) pair draws from a handful of constants; memoize its
+# encoded form so each signature only encodes the timestamp and body.
+@lru_cache(maxsize=64)
+def _path_method_bytes(path, method):
+    return path.encode() + method.encode()
+
+
 # Utility: Generate Signature using HMAC-SHA256
-def generate_signature(api_key, timestamp, path, method, body=""):
-    message = f"{api_key}{timestamp}{path}{method}{body}".encode("utf-8")
-    secret = base64.b64decode(PRIVATE_KEY_BASE64)
-    signature = hmac.new(secret, message, hashlib.sha256).digest()
-    return base64.b64encode(signature).decode("utf-8")
+def generate_signature(timestamp, path, method, body=""):
+    message = b"".join((
+        _API_KEY_B,
+        timestamp.encode(),
+        _path_method_bytes(path, method),
+        body if isinstance(body, bytes) else body.encode(),
+    ))
+    signature = hmac.new(_SECRET, message, hashlib.sha256).digest()
+    # b2a_base64 skips b64encode's wrapper overhead; newline=False drops
+    # the trailing newline it would otherwise append.
+    return b2a_base64(signature, newline=False).decode("ascii")
+
+# GET signatures depend only on (timestamp, path); bursts within the
+# same second reuse the signature instead of re-running the HMAC.
+@lru_cache(maxsize=128)
+def _sign_get_cached(timestamp, path):
+    return generate_signature(timestamp, path, "GET", "")
+
+# The signed timestamp has one-second resolution; cache its string form
+# so bursts of requests within the same second skip the int->str chain.
+# The API's signature validity window (tens of seconds) makes the
+# coarse cache safe.
+_ts_cache = [0, ""]
+
+
+def _timestamp():
+    now = time.time_ns() // 1_000_000_000
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = str(now)
+    return _ts_cache[1]
+
+
+# Constant header fields, copied per request so only the signature and
+# timestamp keys are hashed fresh each call.
+_HEADERS_TEMPLATE = {
+    "x-api-key": API_KEY,
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+}
+
 
 # Utility: Generate Headers
 def get_headers(path, method, body=""):
-    timestamp = str(int(time.time()))
-    signature = generate_signature(API_KEY, timestamp, path, method, body)
-    headers = {
-        "x-api-key": API_KEY,
-        "x-signature": signature,
-        "x-timestamp": timestamp,
-        "Content-Type": "application/json"
-    }
-    logging.info(f"Generated Headers: {headers}")
+    timestamp = _timestamp()
+    if method == "GET" and not body:
+        signature = _sign_get_cached(timestamp, path)
+    else:
+        signature = generate_signature(timestamp, path, method, body)
+    headers = _HEADERS_TEMPLATE.copy()
+    headers["x-signature"] = signature
+    headers["x-timestamp"] = timestamp
+    if _DEBUG_HEADERS:
+        logging.debug("Generated Headers: %s", headers)
     return headers
 
+# Static upstream paths used by the hot routes, with their full URLs
+# precomputed once so constant endpoints skip per-request concatenation.
+_ACCOUNTS_PATH = "/api/v1/crypto/trading/accounts/"
+_ORDERS_PATH = "/api/v1/crypto/trading/orders/"
+_HOLDINGS_PATH = "/api/v1/crypto/trading/holdings/"
+_ACCOUNTS_URL = (BASE_URL or "") + _ACCOUNTS_PATH
+_ORDERS_URL = (BASE_URL or "") + _ORDERS_PATH
+
+# Optional filters accepted by the crypto orders endpoint.
+_ORDER_FILTERS = frozenset((
+    "created_at_start", "created_at_end", "symbol", "id", "side", "state",
+    "type", "updated_at_start", "updated_at_end", "cursor", "limit",
+))
+
+# Separate connect vs read timeouts: a slow handshake or DNS stall is
+# cut off quickly instead of holding a worker for the full read budget.
+_TIMEOUT = (3.05, 10)
+
+# Conditional GET cache: path -> (etag, parsed body). Account/holdings
+# are polled repeatedly but change rarely; a 304 reply carries no body
+# and costs no JSON parse. Paths include client-supplied query strings,
+# so the cache is bounded (LRU) and, since batch sub-requests run on
+# worker threads, guarded by a lock.
+_etag_cache = LRUCache(maxsize=256)
+_etag_lock = threading.Lock()
+
+# Outbound token bucket. The inbound limiter only throttles per client
+# IP; under a burst we would still sign and ship upstream requests just
+# to collect 429s. Check the local quota first so a throttled call skips
+# the HMAC and TLS round-trip. Trading and market-data endpoints are
+# throttled independently upstream, so each prefix gets its own bucket.
+_RATE_LIMIT = 100
+_RATE_WINDOW = 60.0
+_rate_buckets = {}
+_rate_lock = threading.Lock()
+
+
+def _throttle(path):
+    """Sleep until the outbound bucket for this path prefix has room."""
+    key = "marketdata" if path.startswith("/api/v1/crypto/marketdata/") else "trading"
+    with _rate_lock:
+        stamps = _rate_buckets.setdefault(key, deque())
+        now = time.monotonic()
+        while stamps and now - stamps[0] >= _RATE_WINDOW:
+            stamps.popleft()
+        wait = 0.0
+        if len(stamps) >= _RATE_LIMIT:
+            wait = _RATE_WINDOW - (now - stamps[0])
+        stamps.append(now + wait)
+    if wait > 0:
+        logging.warning("Outbound rate limit hit for %s; sleeping %.2fs", key, wait)
+        time.sleep(wait)
+
 # Utility: Make API Request
-def make_request(method, path, body=""):
+def make_request(method, path, body="", url=None):
+    _throttle(path)
     headers = get_headers(path, method, body)
-    url = f"{BASE_URL}{path}"
+    if url is None:
+        url = f"{BASE_URL}{path}"
 
     try:
         response = None
         if method == "GET":
-            response = requests.get(url, headers=headers, timeout=10)
+            with _etag_lock:
+                cached = _etag_cache.get(path)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
+            response = SESSION.get(url, headers=headers, timeout=_TIMEOUT)
+            if response.status_code == 304 and cached is not None:
+                return cached[1]
         elif method == "POST":
-            response = requests.post(url, headers=headers, data=body, timeout=10)
+            response = SESSION.post(url, headers=headers, data=body, timeout=_TIMEOUT)
+
+        # Read the body exactly once; response.text/.json() would each
+        # decode the payload again.
+        raw = response.content
 
         # Raise HTTPError if response status is 4xx or 5xx
         response.raise_for_status()
 
         # Attempt to parse JSON response
         try:
-            response_json = response.json()
-            logging.info(f"Request URL: {url}")
-            logging.info(f"Response Status Code: {response.status_code}")
-            logging.info(f"Response Body: {response_json}")
+            response_json = orjson.loads(raw)
+            if method == "GET":
+                etag = response.headers.get("ETag")
+                if etag:
+                    with _etag_lock:
+                        _etag_cache[path] = (etag, response_json)
+            logging.info("Request URL: %s", url)
+            logging.info("Response Status Code: %s", response.status_code)
+            # Dict repr walks the whole payload; record only the size at
+            # INFO and defer the full body to DEBUG runs.
+            logging.info("Response Body Length: %d", len(raw))
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                # %.512s truncates the dict repr so debug runs do not
+                # stringify multi-kilobyte paginated payloads either.
+                logging.debug("Response Body: %.512s", response_json)
             return response_json
-        except ValueError as json_error:
-            logging.error(f"Response is not JSON. Response text: {response.text}")
-            return {"error": "Invalid JSON response from API", "details": response.text}
+        except orjson.JSONDecodeError as json_error:
+            logging.error("Response is not JSON. Body length: %d", len(raw))
+            return {"error": "Invalid JSON response from API", "details": raw.decode("utf-8", "replace")}
 
     except requests.RequestException as req_error:
-        logging.error(f"Request failed. Headers: {headers}, URL: {url}")
-        logging.error(f"Response Status: {response.status_code if response else 'No Response'}")
-        logging.error(f"Response Body: {response.text if response else 'No Response Body'}")
-        logging.error(f"Error details: {req_error}")
+        logging.error("Request failed. URL: %s", url)
+        logging.error("Response Status: %s", response.status_code if response is not None else "No Response")
+        logging.error("Response Body Length: %s",
+                      len(response.content) if response is not None else "No Response Body")
+        logging.error("Error details: %s", req_error)
         return {"error": "Request failed", "details": str(req_error)}
     except Exception as general_error:
-        logging.error(f"Unexpected error occurred: {general_error}")
+        logging.error("Unexpected error occurred: %s", general_error)
         return {"error": "An unexpected error occurred", "details": str(general_error)}
 
 # Routes
 @app.route("/")
 def home():
-    return jsonify({"message": "TraderGPT API is live!"}), 200
+    return _json_response({"message": "TraderGPT API is live!"}, 200)
 
 # Fetch crypto orders
 @limiter.limit("10 per minute")
@@ -109,145 +296,186 @@ def fetch_crypto_orders():
     """
     Fetch the history of crypto orders from the Robinhood API with optional filters.
     """
-    # Collect optional query parameters
-    query_params = {
-        "created_at_start": request.args.get("created_at_start"),
-        "created_at_end": request.args.get("created_at_end"),
-        "symbol": request.args.get("symbol"),
-        "id": request.args.get("id"),
-        "side": request.args.get("side"),
-        "state": request.args.get("state"),
-        "type": request.args.get("type"),
-        "updated_at_start": request.args.get("updated_at_start"),
-        "updated_at_end": request.args.get("updated_at_end"),
-        "cursor": request.args.get("cursor"),
-        "limit": request.args.get("limit")
-    }
-
-    # Filter out None values to build query string
-    filtered_params = {k: v for k, v in query_params.items() if v is not None}
-    query_string = "&".join(f"{key}={value}" for key, value in filtered_params.items())
-    path = "/api/v1/crypto/trading/orders/"
-    if query_string:
-        path += f"?{query_string}"
+    # Iterate the parsed args directly instead of materializing an
+    # intermediate dict; repeated keys are preserved and urlencode (which
+    # runs in C) escapes values the old f-string join silently mangled.
+    filtered_params = [
+        (k, v) for k, v in request.args.items(multi=True) if k in _ORDER_FILTERS
+    ]
+    path = _ORDERS_PATH
+    if filtered_params:
+        path += "?" + urlencode(filtered_params)
 
     # Make the GET request to the Robinhood API
     orders_data = make_request("GET", path)
 
     # Handle errors and return the response
     if "error" in orders_data:
-        return jsonify({"error": "Failed to fetch crypto orders", "details": orders_data.get("error")}), 500
+        return _json_response({"error": "Failed to fetch crypto orders", "details": orders_data.get("error")}, 500)
 
-    return jsonify(orders_data), 200
+    return _json_response(orders_data, 200)
 
 # Fetch account details
 @limiter.limit("10 per minute")
 @app.route("/proxy/fetch_account", methods=["GET"])
 def fetch_account():
-    path = "/api/v1/crypto/trading/accounts/"
-    account_data = make_request("GET", path)
-    return jsonify({"response_data": account_data})
+    account_data = make_request("GET", _ACCOUNTS_PATH, url=_ACCOUNTS_URL)
+    return _json_response({"response_data": account_data})
 
 # Fetch crypto holdings
 @limiter.limit("10 per minute")
 @app.route("/proxy/crypto_holdings", methods=["GET"])
 def fetch_crypto_holdings():
-    asset_code = request.args.get("asset_code")
-    limit = request.args.get("limit")
-    cursor = request.args.get("cursor")
-
-    query_params = []
-    if asset_code:
-        query_params.append(f"asset_code={asset_code}")
-    if limit:
-        query_params.append(f"limit={limit}")
-    if cursor:
-        query_params.append(f"cursor={cursor}")
-
-    query_string = "&".join(query_params)
-    path = f"/api/v1/crypto/trading/holdings/"
-    if query_string:
-        path += f"?{query_string}"
+    params = {
+        k: v
+        for k, v in (
+            ("asset_code", request.args.get("asset_code")),
+            ("limit", request.args.get("limit")),
+            ("cursor", request.args.get("cursor")),
+        )
+        if v
+    }
+    path = _HOLDINGS_PATH + ("?" + urlencode(params) if params else "")
 
     holdings_data = make_request("GET", path)
     if "error" in holdings_data:
-        return jsonify({"error": "Failed to fetch crypto holdings", "details": holdings_data["error"]}), 500
-    return jsonify(holdings_data), 200
+        return _json_response({"error": "Failed to fetch crypto holdings", "details": holdings_data["error"]}, 500)
+    return _json_response(holdings_data, 200)
 
 # Fetch crypto account details
 @limiter.limit("10 per minute")
 @app.route("/proxy/crypto_account_details", methods=["GET"])
 def fetch_crypto_account_details():
-    path = "/api/v1/crypto/trading/accounts/"
-    account_details = make_request("GET", path)
+    account_details = make_request("GET", _ACCOUNTS_PATH, url=_ACCOUNTS_URL)
     if "error" in account_details:
-        return jsonify({
+        return _json_response({
             "error": "Failed to fetch account details",
             "details": account_details["error"]
-        }), 500
-    return jsonify(account_details), 200
+        }, 500)
+    return _json_response(account_details, 200)
+
+class OrderError(Exception):
+    """Order input rejected before any I/O; carries the HTTP status."""
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+# Validate order input and build the upstream payload (sans order id)
+def _validate_order(order_data):
+    if not order_data:
+        raise OrderError("No JSON body provided")
+
+    # Required fields check
+    for field in ("symbol", "side", "type"):
+        if field not in order_data:
+            raise OrderError(f"Missing field: {field}")
+
+    payload = {
+        "side": order_data["side"].lower(),  # Ensure lowercase
+        "type": order_data["type"].lower(),
+        "symbol": order_data["symbol"].upper()  # Ensure uppercase
+    }
+
+    # Market Order
+    if payload["type"] == "market":
+        if "usd_amount" not in order_data:
+            raise OrderError("usd_amount required for market orders")
+        payload["market_order_config"] = {
+            "quote_amount": f"{order_data['usd_amount']:.2f}"  # Format as string
+        }
+
+    # Limit Order
+    elif payload["type"] == "limit":
+        for field in ("limit_price", "usd_amount"):
+            if field not in order_data:
+                raise OrderError(f"Missing field: {field}")
+        payload["limit_order_config"] = {
+            "limit_price": f"{order_data['limit_price']:.2f}",
+            "quote_amount": f"{order_data['usd_amount']:.2f}",
+            "time_in_force": order_data.get("time_in_force", "gtc")
+        }
+
+    else:
+        raise OrderError("Unsupported order type")
+
+    return payload
 
 # Place a crypto order
 @limiter.limit("10 per minute")
 @app.route("/proxy/place_order", methods=["POST"])
 def place_order():
     try:
-        order_data = request.json
-        if not order_data:
-            return jsonify({"error": "No JSON body provided"}), 400
-
-        # Required fields check
-        required = ["symbol", "side", "type"]
-        for field in required:
-            if field not in order_data:
-                return jsonify({"error": f"Missing field: {field}"}), 400
-
-        # Build payload
-        payload = {
-            "client_order_id": str(uuid.uuid4()),
-            "side": order_data["side"].lower(),  # Ensure lowercase
-            "type": order_data["type"].lower(),
-            "symbol": order_data["symbol"].upper()  # Ensure uppercase
-        }
+        # All validation runs before any per-order work; the order id is
+        # only generated once the input is known to be good.
+        try:
+            payload = _validate_order(request.json)
+        except OrderError as err:
+            return _json_response({"error": str(err)}, err.status)
+        payload["client_order_id"] = _client_order_id()
 
-        # Market Order
-        if payload["type"] == "market":
-            if "usd_amount" not in order_data:
-                return jsonify({"error": "usd_amount required for market orders"}), 400
-            payload["market_order_config"] = {
-                "quote_amount": f"{order_data['usd_amount']:.2f}"  # Format as string
-            }
-
-        # Limit Order
-        elif payload["type"] == "limit":
-            required_limit = ["limit_price", "usd_amount"]
-            for field in required_limit:
-                if field not in order_data:
-                    return jsonify({"error": f"Missing field: {field}"}), 400
-            payload["limit_order_config"] = {
-                "limit_price": f"{order_data['limit_price']:.2f}",
-                "quote_amount": f"{order_data['usd_amount']:.2f}",
-                "time_in_force": order_data.get("time_in_force", "gtc")
-            }
-
-        else:
-            return jsonify({"error": "Unsupported order type"}), 400
-
-        # Send request
-        body_json = json.dumps(payload)
-        path = "/api/v1/crypto/trading/orders/"
-        response = make_request("POST", path, body_json)
+        # Send request (compact separators shorten both the signed message
+        # and the POST payload)
+        body_json = orjson.dumps(payload).decode()
+        response = make_request("POST", _ORDERS_PATH, body_json, url=_ORDERS_URL)
 
         if "error" in response:
-            logging.error(f"API Error: {response.get('error')}")
-            return jsonify({"error": "Order failed", "details": response}), 500
+            logging.error("API Error: %s", response.get("error"))
+            return _json_response({"error": "Order failed", "details": response}, 500)
 
-        return jsonify(response), 201
+        return _json_response(response, 201)
 
     except Exception as e:
-        logging.error(f"Error: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logging.error("Error: %s", e)
+        return _json_response({"error": "Internal server error"}, 500)
 
-# Run the app
+# Worker pool for fanning batch sub-requests out in parallel over the
+# shared session's warm connections.
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Issue several upstream calls in one proxy round-trip
+@limiter.limit("10 per minute")
+@app.route("/proxy/batch", methods=["POST"])
+def proxy_batch():
+    """Run a list of upstream calls concurrently and return all results.
+
+    A dashboard load needs account, holdings, orders and a quote; as
+    separate proxy calls those serialize on upstream RTT. Accepts a JSON
+    array of {"method", "path", "body"} entries, fans them out over the
+    thread pool, and returns the results in request order, so the page
+    costs max(RTTs) instead of sum(RTTs).
+    """
+    entries = request.json
+    if not isinstance(entries, list) or not entries:
+        return _json_response({"error": "Expected a non-empty JSON array"}, 400)
+    if len(entries) > 16:
+        return _json_response({"error": "Too many batch entries (max 16)"}, 400)
+
+    calls = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            return _json_response({"error": "Invalid batch entry", "details": entry}, 400)
+        method = entry.get("method", "GET").upper()
+        path = entry.get("path", "")
+        if method not in ("GET", "POST") or not path.startswith("/api/v1/crypto/"):
+            return _json_response({"error": "Invalid batch entry", "details": entry}, 400)
+        # Bodies arrive as JSON objects from well-behaved clients;
+        # serialize those, pass strings through, reject anything else.
+        body = entry.get("body", "")
+        if isinstance(body, (dict, list)):
+            body = orjson.dumps(body).decode()
+        elif not isinstance(body, str):
+            return _json_response({"error": "Invalid batch entry body", "details": entry}, 400)
+        calls.append((method, path, body))
+
+    # Dispatch only once the whole batch has validated: a bad entry must
+    # reject the request before any sub-request (e.g. an order POST) has
+    # gone upstream, or a client retry would replay the good entries.
+    futures = [
+        _BATCH_EXECUTOR.submit(make_request, method, path, body)
+        for method, path, body in calls
+    ]
+    return _json_response([future.result() for future in futures])
+
+# Run the app (dev only; production runs through wsgi.py under gunicorn)
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    app.run(host="0.0.0.0", port=5000, debug=os.getenv("FLASK_DEBUG") == "1", threaded=True)
@@ -0,0 +1,11 @@
+import base64
+import os
+import sys
+
+# Ensure the project root is importable and credentials exist before any
+# test module imports trading_core, which reads them at import time.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+os.environ.setdefault("API_KEY", "test-api-key")
+os.environ.setdefault("PRIVATE_KEY_BASE64", base64.b64encode(b"0" * 32).decode())
+os.environ.setdefault("BASE_URL", "https://example.com")
@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import time
 import json  
@@ -11,11 +13,30 @@ API_KEY = "rh-api-4af555a6-8627-4287-9294-b34d55415885"  # Provided by Robinhood
 PRIVATE_KEY_BASE64 = "0Z5uAK4jB2pdSzipgn7Lu7D3Cu7yY2gUo4Q4hcG6rxs="  # From the key generation step
 BASE_URL = "https://trading.robinhood.com"
 
+# Decode the private key once at module load instead of per signature,
+# and pre-encode the constant API key so messages are built as plain bytes
+_SIGNING_KEY = SigningKey(base64.b64decode(PRIVATE_KEY_BASE64))
+_API_KEY_B = API_KEY.encode()
+
+# Pooled keep-alive session so the three calls in this script reuse one
+# TLS connection; transient upstream 5xx replies are retried.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+))
+
 # Generate a Signature
 def generate_signature(api_key, timestamp, path, method, body=""):
-    message = f"{api_key}{timestamp}{path}{method}{body}"
-    private_key = SigningKey(base64.b64decode(PRIVATE_KEY_BASE64))
-    signature = private_key.sign(message.encode("utf-8")).signature
+    message = b"".join((
+        _API_KEY_B,
+        timestamp.encode(),
+        path.encode(),
+        method.encode(),
+        body.encode() if isinstance(body, str) else body,
+    ))
+    signature = _SIGNING_KEY.sign(message).signature
     return base64.b64encode(signature).decode("utf-8")
 
 # Build Authorization Headers
@@ -34,7 +55,7 @@ def fetch_account():
     path = "/api/v1/crypto/trading/accounts/"
     url = BASE_URL + path
     headers = get_headers(path, "GET")
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers, timeout=10)
     return response.json()
 
 if __name__ == "__main__":
@@ -47,7 +68,7 @@ def get_best_bid_ask(symbol="BTC-USD"):
     path = f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
     url = BASE_URL + path
     headers = get_headers(path, "GET")
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers, timeout=10)
     return response.json()
 
 if __name__ == "__main__":
@@ -89,7 +110,7 @@ def place_market_order(symbol, side, usd_amount):
 
     # Send the request
     try:
-        response = requests.post(url, headers=headers, data=body)
+        response = SESSION.post(url, headers=headers, data=body, timeout=10)
         print("\nResponse Status Code:", response.status_code)
         print("Response Body:", response.json())
 
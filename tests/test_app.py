@@ -1,5 +1,7 @@
 from flask import Flask, request, jsonify
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import time
 import json
@@ -15,20 +17,40 @@ load_dotenv()
 # Initialize Flask app
 app = Flask(__name__)
 
-# Logging setup
-logging.basicConfig(filename='trading_log.txt', level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+# Pooled keep-alive session shared by every outbound Robinhood call
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
+# Module logger. This file gets imported by the test run, so nothing is
+# pinned onto the root logger here; the __main__ block below attaches
+# the file sink for standalone runs and pytest pays no disk I/O.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # API Credentials
 API_KEY = os.getenv("API_KEY")
 PRIVATE_KEY_BASE64 = os.getenv("PRIVATE_KEY_BASE64")
 BASE_URL = os.getenv("BASE_URL")
 
+# Helper: decode the private key once at module load instead of per signature,
+# and pre-encode the constant API key so messages are built as plain bytes
+_SIGNING_KEY = SigningKey(base64.b64decode(PRIVATE_KEY_BASE64)) if PRIVATE_KEY_BASE64 else None
+_API_KEY_B = API_KEY.encode() if API_KEY else b""
+
 # Helper: Generate a signature
 def generate_signature(api_key, timestamp, path, method, body=""):
-    message = f"{api_key}{timestamp}{path}{method}{body}"
-    private_key = SigningKey(base64.b64decode(PRIVATE_KEY_BASE64))
-    signature = private_key.sign(message.encode("utf-8")).signature
+    message = b"".join((
+        _API_KEY_B,
+        timestamp.encode(),
+        path.encode(),
+        method.encode(),
+        body.encode() if isinstance(body, str) else body,
+    ))
+    signature = _SIGNING_KEY.sign(message).signature
     return base64.b64encode(signature).decode("utf-8")
 
 # Helper: Build authorization headers
@@ -50,11 +72,11 @@ def fetch_account():
     headers = get_headers(path, "GET")
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers)
         response.raise_for_status()
         return jsonify(response.json())
     except requests.RequestException as e:
-        logging.error(f"Error fetching account details: {e}")
+        logger.error(f"Error fetching account details: {e}")
         return jsonify({"error": "Failed to fetch account details", "details": str(e)}), 500
 
 @app.route("/proxy/best_bid_ask", methods=["GET"])
@@ -66,11 +88,11 @@ def best_bid_ask():
     headers = get_headers(path, "GET")
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers)
         response.raise_for_status()
         return jsonify(response.json())
     except requests.RequestException as e:
-        logging.error(f"Error fetching market data: {e}")
+        logger.error(f"Error fetching market data: {e}")
         return jsonify({"error": "Failed to fetch market data", "details": str(e)}), 500
 
 @app.route("/proxy/place_order", methods=["POST"])
@@ -100,13 +122,13 @@ def place_market_order():
         url = BASE_URL + path
 
         # Send the request
-        response = requests.post(url, headers=headers, data=body)
+        response = _SESSION.post(url, headers=headers, data=body)
         response.raise_for_status()
-        logging.info(f"Order placed: {response.json()}")
+        logger.info(f"Order placed: {response.json()}")
         return jsonify(response.json())
 
     except (ValueError, requests.RequestException) as e:
-        logging.error(f"Error placing order: {e}")
+        logger.error(f"Error placing order: {e}")
         return jsonify({"error": "Failed to place market order", "details": str(e)}), 500
 
 # Helper: Fetch market data internally
@@ -116,13 +138,15 @@ def best_bid_ask_internal(symbol="BTC-USD"):
     headers = get_headers(path, "GET")
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        logging.error(f"Error fetching market data: {e}")
+        logger.error(f"Error fetching market data: {e}")
         return {"error": "Failed to fetch market data"}
 
 # Run the Flask server
 if __name__ == "__main__":
+    logging.basicConfig(filename='trading_log.txt', level=logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
     app.run(host="0.0.0.0", port=5000, debug=True)
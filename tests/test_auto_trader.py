@@ -1,11 +1,12 @@
+import json
 import os
 import sys
 import unittest
-from unittest.mock import patch, call
+from unittest.mock import patch, call, Mock
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from auto_trader import auto_trade
+from auto_trader import auto_trade, fetch_prices
 
 
 class TestAutoTrader(unittest.TestCase):
@@ -24,6 +25,24 @@ class TestAutoTrader(unittest.TestCase):
         ]
         self.assertEqual(mock_order.call_args_list, expected_calls)
 
+    def test_fetch_prices_batches_symbols(self):
+        mock_resp = Mock()
+        mock_resp.raise_for_status.return_value = None
+        mock_resp.content = json.dumps({
+            "results": [
+                {"symbol": "BTC-USD", "ask_inclusive_of_buy_spread": "100.0"},
+                {"symbol": "ETH-USD", "ask_inclusive_of_buy_spread": "10.0"},
+            ]
+        }).encode()
+        with patch("auto_trader.BASE_URL", "https://example.com"), \
+             patch("auto_trader.get_headers", return_value={}), \
+             patch("auto_trader.SESSION.get", return_value=mock_resp) as mock_get:
+            prices = fetch_prices(["BTC-USD", "ETH-USD"])
+
+        mock_get.assert_called_once()
+        self.assertIn("symbol=BTC-USD&symbol=ETH-USD", mock_get.call_args[0][0])
+        self.assertEqual(prices, {"BTC-USD": 100.0, "ETH-USD": 10.0})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import json
+import os
+import sys
+from unittest.mock import patch, Mock
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Keep the rate limiter off Redis when the proxy app is imported
+os.environ.setdefault("LIMITER_STORAGE", "memory://")
+
+from robinhood_api_trading import app
+
+
+@pytest.fixture
+def client():
+    with app.test_client() as client:
+        yield client
+
+
+def _mock_response(payload):
+    resp = Mock()
+    resp.content = json.dumps(payload).encode()
+    resp.status_code = 200
+    resp.raise_for_status.return_value = None
+    resp.headers = {}
+    return resp
+
+
+def test_batch_returns_results_in_order(client):
+    resp = _mock_response({"ok": True})
+    with patch("robinhood_api_trading.SESSION.get", return_value=resp), \
+         patch("robinhood_api_trading.SESSION.post", return_value=resp):
+        response = client.post("/proxy/batch", json=[
+            {"method": "GET", "path": "/api/v1/crypto/trading/accounts/"},
+            {"method": "POST", "path": "/api/v1/crypto/trading/orders/",
+             "body": {"symbol": "BTC-USD"}},
+        ])
+
+    assert response.status_code == 200
+    assert response.get_json() == [{"ok": True}, {"ok": True}]
+
+
+def test_batch_invalid_entry_dispatches_nothing(client):
+    # A bad entry anywhere must reject the batch before any sub-request
+    # (such as an order POST) has gone upstream.
+    with patch("robinhood_api_trading.SESSION.get") as mock_get, \
+         patch("robinhood_api_trading.SESSION.post") as mock_post:
+        response = client.post("/proxy/batch", json=[
+            {"method": "POST", "path": "/api/v1/crypto/trading/orders/",
+             "body": {"symbol": "BTC-USD"}},
+            {"method": "DELETE", "path": "/api/v1/crypto/trading/orders/x/"},
+        ])
+
+    assert response.status_code == 400
+    mock_get.assert_not_called()
+    mock_post.assert_not_called()
+
+
+def test_batch_rejects_non_dict_entry(client):
+    response = client.post("/proxy/batch", json=["foo"])
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_batch_rejects_non_serializable_body(client):
+    response = client.post("/proxy/batch", json=[
+        {"method": "GET", "path": "/api/v1/crypto/trading/accounts/", "body": 5},
+    ])
+    assert response.status_code == 400
+    assert "error" in response.get_json()
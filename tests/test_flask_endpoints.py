@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 import base64
@@ -24,11 +25,11 @@ def test_fetch_account_returns_expected_data(client):
     sample_response = {"account": "demo"}
 
     mock_resp = Mock()
-    mock_resp.json.return_value = sample_response
+    mock_resp.content = json.dumps(sample_response).encode()
     mock_resp.status_code = 200
     mock_resp.raise_for_status.return_value = None
 
-    with patch('requests.get', return_value=mock_resp) as mock_get:
+    with patch('trading_core.SESSION.get', return_value=mock_resp) as mock_get:
         response = client.get('/proxy/fetch_account')
         mock_get.assert_called_once()
 
@@ -0,0 +1,314 @@
+"""Shared Robinhood trading client and Flask blueprint.
+
+The proxy entrypoints each re-implemented signing, header construction
+and the same routes, so importing any two of them double-registered
+routes and duplicated module state. The HTTP session, cached signing
+key, market-data cache and the proxy routes live here once; entrypoints
+just create a Flask app and register the blueprint.
+"""
+
+from flask import Blueprint, current_app, request
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import base64
+from binascii import b2a_base64
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import uuid
+import logging
+import os
+import re
+from functools import lru_cache
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Shared HTTP session: keep-alive + pooled connections amortize the TLS
+# handshake across all outbound Robinhood calls.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
+
+# API Credentials (Replace with your working credentials)
+API_KEY = os.getenv("API_KEY")
+PRIVATE_KEY_BASE64 = os.getenv("PRIVATE_KEY_BASE64")
+BASE_URL = os.getenv("BASE_URL")
+
+# Decode the private key once at import; rebuilding the key object per
+# request repeats the base64 decode and Ed25519 key expansion for
+# nothing. OpenSSL's Ed25519 (via cryptography) picks up hardware SHA
+# acceleration where available and signs without the SignedMessage
+# wrapper PyNaCl allocates per call.
+_SIGNING_KEY = (
+    Ed25519PrivateKey.from_private_bytes(base64.b64decode(PRIVATE_KEY_BASE64))
+    if PRIVATE_KEY_BASE64 else None
+)
+
+# The API key never changes per process; encode it once so the signed
+# message can be assembled as bytes without f-string formatting.
+_API_KEY_B = API_KEY.encode() if API_KEY else b""
+
+bp = Blueprint("trading", __name__)
+
+# Separate connect vs read timeouts: a slow handshake or DNS stall is
+# cut off quickly instead of holding a worker for the full read budget.
+_TIMEOUT = (3.05, 10)
+
+
+# Worker pool for overlapping the order-placement quote fetch with local
+# payload construction; quote calls are short, so a few workers suffice.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Static API paths, plus memoized per-symbol market-data paths/URLs so
+# hot endpoints skip rebuilding the same strings on every request.
+_ACCOUNTS_PATH = "/api/v1/crypto/trading/accounts/"
+_ORDERS_PATH = "/api/v1/crypto/trading/orders/"
+_ACCOUNTS_URL = (BASE_URL or "") + _ACCOUNTS_PATH
+_ORDERS_URL = (BASE_URL or "") + _ORDERS_PATH
+
+# Trading pairs look like BTC-USD; reject anything else before spending
+# a signed round-trip on it.
+_SYMBOL_RE = re.compile(r"^[A-Z]{2,5}-USD$")
+
+
+def _client_order_id():
+    # Only uniqueness matters for client_order_id; building the UUID
+    # straight from urandom bytes keeps the dashed format the API
+    # expects while skipping uuid4()'s extra wrapper work.
+    return str(uuid.UUID(bytes=os.urandom(16), version=4))
+
+
+@lru_cache(maxsize=64)
+def _bid_ask_path(symbol):
+    return f"/api/v1/crypto/marketdata/best_bid_ask/?symbol={symbol}"
+
+
+@lru_cache(maxsize=64)
+def _bid_ask_url(symbol):
+    return BASE_URL + _bid_ask_path(symbol)
+
+
+def _json_response(payload, status=200):
+    """Serialize a response with orjson instead of jsonify's stdlib json."""
+    return current_app.response_class(
+        orjson.dumps(payload), mimetype="application/json", status=status
+    )
+
+
+# The signed timestamp has one-second resolution; cache its string form
+# so bursts of requests within the same second skip the conversion.
+_ts_cache = [0, ""]
+
+
+def _timestamp():
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = str(now)
+    return _ts_cache[1]
+
+
+# The (path, method) pair draws from a handful of constants; memoize its
+# encoded form so each signature only encodes the timestamp and body.
+@lru_cache(maxsize=64)
+def _path_method_bytes(path, method):
+    return path.encode() + method.encode()
+
+
+# Generate a Signature (Same as your working script)
+def generate_signature(timestamp, path, method, body=""):
+    message = b"".join((
+        _API_KEY_B,
+        timestamp.encode(),
+        _path_method_bytes(path, method),
+        body if isinstance(body, bytes) else body.encode(),
+    ))
+    signature = _SIGNING_KEY.sign(message)
+    # b2a_base64 skips b64encode's wrapper overhead; newline=False drops
+    # the trailing newline it would otherwise append.
+    return b2a_base64(signature, newline=False).decode("ascii")
+
+
+# GET signatures depend only on (timestamp, path); within one second a
+# burst of identical GETs can reuse the signature instead of re-signing.
+# POST bodies carry a fresh client_order_id, so caching those is useless.
+@lru_cache(maxsize=128)
+def _sign_get_cached(timestamp, path):
+    return generate_signature(timestamp, path, "GET", "")
+
+
+# Constant header fields, copied per request so only the signature and
+# timestamp keys are hashed fresh each call.
+_HEADERS_TEMPLATE = {
+    "x-api-key": API_KEY,
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+}
+
+
+# Build Authorization Headers (Same as your working script)
+def get_headers(path, method, body=""):
+    timestamp = _timestamp()
+    if method == "GET" and not body:
+        signature = _sign_get_cached(timestamp, path)
+    else:
+        signature = generate_signature(timestamp, path, method, body)
+    headers = _HEADERS_TEMPLATE.copy()
+    headers["x-signature"] = signature
+    headers["x-timestamp"] = timestamp
+    logging.debug("Generated headers: %s", headers)
+    return headers
+
+
+# Route 1: Fetch Account Details
+@bp.route("/proxy/fetch_account", methods=["GET"])
+def fetch_account():
+    path = _ACCOUNTS_PATH
+    url = _ACCOUNTS_URL
+    headers = get_headers(path, "GET")
+
+    try:
+        response = SESSION.get(url, headers=headers, timeout=_TIMEOUT)
+        response.raise_for_status()
+        return _json_response(orjson.loads(response.content))
+    except requests.RequestException as e:
+        logging.error(f"Error fetching account details: {e}")
+        return _json_response({"error": "Failed to fetch account details", "details": str(e)}, 500)
+
+
+# Route 2: Get Best Bid/Ask Price
+@bp.route("/proxy/best_bid_ask", methods=["GET"])
+def best_bid_ask():
+    # Share the cached helper with the order path so a quote fetched for
+    # either route serves both within the TTL window.
+    symbol = request.args.get("symbol", "BTC-USD")
+    market_data = best_bid_ask_internal(symbol)
+    if "error" in market_data:
+        return _json_response(market_data, 500)
+    return _json_response(market_data)
+
+
+# Route 3: Place Market Order
+@bp.route("/proxy/place_order", methods=["POST"])
+def place_market_order():
+    try:
+        # Parse incoming request JSON
+        data = request.get_json()
+        symbol = data.get("symbol", "BTC-USD")
+        side = data.get("side", "buy")
+
+        # Cheap validation first: malformed orders are rejected without
+        # a quote fetch, a signature, or a network call.
+        if side not in ("buy", "sell"):
+            return _json_response({"error": "side must be 'buy' or 'sell'"}, 400)
+        if not isinstance(symbol, str) or not _SYMBOL_RE.match(symbol):
+            return _json_response({"error": "Invalid symbol", "details": symbol}, 400)
+        try:
+            usd_amount = float(data.get("usd_amount", 5.0))  # Default to $5
+        except (TypeError, ValueError):
+            return _json_response({"error": "usd_amount must be a number"}, 400)
+        if usd_amount <= 0:
+            return _json_response({"error": "usd_amount must be positive"}, 400)
+
+        # Fetch the quote on a worker thread; the UUID and the parts of
+        # the payload that do not depend on price are built while the
+        # quote request is in flight.
+        quote_future = _EXECUTOR.submit(best_bid_ask_internal, symbol)
+        payload = {
+            "client_order_id": _client_order_id(),
+            "side": side,
+            "symbol": symbol,
+            "type": "market",
+        }
+
+        market_data = quote_future.result()
+        if "error" in market_data:
+            return _json_response({"error": "Failed to fetch market data for order"}, 500)
+
+        btc_price = float(market_data["results"][0]["ask_inclusive_of_buy_spread"])
+        btc_quantity = usd_amount / btc_price
+        payload["market_order_config"] = {"asset_quantity": f"{btc_quantity:.8f}"}
+
+        # Serialize once to compact bytes and reuse the same buffer for
+        # the signature and the POST body.
+        path = _ORDERS_PATH
+        body = orjson.dumps(payload)
+
+        logging.debug("Order payload: %s", body)
+        headers = get_headers(path, "POST", body)
+        url = _ORDERS_URL
+
+        # Send the request
+        response = SESSION.post(url, headers=headers, data=body, timeout=_TIMEOUT)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        logging.info("Order placed: %s", result)
+        return _json_response(result)
+
+    except (ValueError, requests.RequestException) as e:
+        logging.error(f"Error placing order: {e}")
+        return _json_response({"error": "Failed to place market order", "details": str(e)}, 500)
+
+
+# Market data cache: order placement fetches a quote on every call, so a
+# short TTL spares the Robinhood API a round-trip for bursty orders
+# while keeping quotes at most half a second stale. TTLCache is not
+# thread-safe, and gevent/threaded workers share this module.
+_market_data_cache = TTLCache(maxsize=256, ttl=0.5)
+_market_data_lock = threading.Lock()
+# In-flight quote fetches by symbol: concurrent misses for the same
+# symbol wait on one upstream call instead of each issuing their own.
+_quote_futures = {}
+
+
+# Helper: Fetch Best Bid/Ask Price Internally
+def best_bid_ask_internal(symbol):
+    with _market_data_lock:
+        cached = _market_data_cache.get(symbol)
+        if cached is not None:
+            return cached
+        future = _quote_futures.get(symbol)
+        fetch_owner = future is None
+        if fetch_owner:
+            future = Future()
+            _quote_futures[symbol] = future
+
+    if not fetch_owner:
+        # Bounded wait so a wedged fetch cannot hang waiters forever.
+        return future.result(timeout=_TIMEOUT[0] + _TIMEOUT[1])
+
+    # The owner must always deregister and complete the future, even on
+    # unexpected errors (e.g. a 200 with a non-JSON body), or every
+    # later call for this symbol would block on a future nobody fills.
+    try:
+        path = _bid_ask_path(symbol)
+        url = _bid_ask_url(symbol)
+        headers = get_headers(path, "GET")
+
+        try:
+            response = SESSION.get(url, headers=headers, timeout=_TIMEOUT)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError):
+            data = {"error": "Failed to fetch market data"}
+
+        with _market_data_lock:
+            if "error" not in data:
+                _market_data_cache[symbol] = data
+        future.set_result(data)
+        return data
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _market_data_lock:
+            _quote_futures.pop(symbol, None)
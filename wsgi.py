@@ -0,0 +1,13 @@
+"""WSGI entrypoint for the standalone proxy.
+
+Run it under a real server instead of the single-threaded Werkzeug dev
+server, e.g.:
+
+    gunicorn -c gunicorn.conf.py --preload wsgi:app
+
+The session, signing secret and rate-limit state are module-level
+singletons created at import, so ``--preload`` builds them once and
+shares them across forked workers.
+"""
+
+from robinhood_api_trading import app  # noqa: F401